@@ -1,9 +1,17 @@
 import logging
+from operator import attrgetter
 
 from ..base import *
 
 logger = logging.getLogger('Console')
 
+_value = attrgetter('value')
+
+
+def _format_args(arguments):
+    """Join the values of the JS arguments with spaces"""
+    return ' '.join(_value(x) for x in arguments.to_list())
+
 
 @Js
 def console():
@@ -12,32 +20,32 @@ def console():
 
 @Js
 def log():
-    payload = ' '.join(map(lambda x: x.value, arguments.to_list()))
-    logger.log(0, payload)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_format_args(arguments))
 
 
 @Js
 def debug():
-    payload = ' '.join(map(lambda x: x.value, arguments.to_list()))
-    logger.debug(payload)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(_format_args(arguments))
 
 
 @Js
 def info():
-    payload = ' '.join(map(lambda x: x.value, arguments.to_list()))
-    logger.info(payload)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_format_args(arguments))
 
 
 @Js
 def warn():
-    payload = ' '.join(map(lambda x: x.value, arguments.to_list()))
-    logger.warning(payload)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(_format_args(arguments))
 
 
 @Js
 def error():
-    payload = ' '.join(map(lambda x: x.value, arguments.to_list()))
-    logger.error(payload)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(_format_args(arguments))
 
 
 console.put('log', log)
@@ -2,16 +2,22 @@
 packages into python.
 """
 
+import atexit
 import codecs
 import hashlib
+import importlib.util
+import json
 import logging
+import marshal
 import os
-import random
+import py_compile
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from shutil import rmtree
 
-import six
-
 from js2py.evaljs import translate_js, DEFAULT_HEADER
 from js2py.translators.friendly_nodes import is_valid_py_name
 
@@ -31,6 +37,26 @@ PY_MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'py_no
 
 logger = logging.getLogger('JS Translator')
 
+# skip the audit and funding requests, and use the cached packages when possible
+_NPM_INSTALL_FLAGS = ['--no-audit', '--no-fund', '--prefer-offline']
+
+# the first line of a translated python module is ``<_HEADER_PREFIX><version>``
+_HEADER_PREFIX = '# version: '
+
+# ``(version, module_path)`` of the installed Node.js modules, keyed by ``(pkg_name, abspath(cwd))``.
+# Cleared whenever ``npm install`` runs.
+_MODULE_INFO_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+# modules loaded by ``require`` without a context, keyed by ``(pkg_name, version, mtime, size)`` of the python module.
+_REQUIRE_CACHE = {}
+_REQUIRE_LOCK = threading.Lock()
+# code objects of the python modules: ``{py_path: ((mtime, size), code)}``
+_CODE_CACHE = {}
+
+# whether the dependencies for JS interpreting have been checked by ``_init`` in this process
+_INIT_DONE = False
+
 
 # ======================================= Node.js EXTENSIONS ===================================
 
@@ -38,20 +64,99 @@ def run_cmd(cmd, **kwargs):
     """Run shell command.
 
     Args:
-        cmd (str): the command
-        kwargs (dict): arguments to ``subprocess.check_output``
+        cmd (str or list): the command. A string is run through the shell, while a list of arguments is executed
+                           directly without spawning a shell.
+        kwargs (dict): arguments to ``subprocess.Popen``
 
     Returns:
         2-tuple: ``(status_code, output)``. The former is a status code, 0 means no error occurs.
                  The latter is the output in string.
     """
-    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True, **kwargs)
+    shell = isinstance(cmd, str)
+    try:
+        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=shell, **kwargs)
+    except OSError as e:
+        # the executable is not found, the same status code as the shell
+        return 127, str(e)
     out, err = p.communicate()
     if p.returncode == 0:
         return 0, out.decode('utf-8')
     return p.returncode, err.decode('utf-8')
 
 
+_NODE_EVALUATOR_SCRIPT = '''
+const path = require('path');
+const {createRequire} = require('module');
+require('readline').createInterface({input: process.stdin}).on('line', (line) => {
+    let response;
+    try {
+        const request = JSON.parse(line);
+        const req = createRequire(path.join(request.cwd, '[eval]'));
+        response = {value: new Function('require', 'return (' + request.expr + ');')(req)};
+    } catch (e) {
+        response = {error: String(e && e.message || e)};
+    }
+    process.stdout.write(JSON.stringify(response) + '\\n');
+});
+'''
+
+
+class _NodeEvaluator(object):
+    """A long-lived ``node`` process evaluating JS expressions line by line, so that probing the installed modules
+    doesn't pay for the startup of a new ``node`` process every time. The process is started at the first use."""
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+
+    def eval(self, expr, cwd='.'):
+        """Evaluate a JS expression.
+
+        Args:
+            expr (str): the JS expression. ``require`` in it resolves the modules from ``cwd``.
+            cwd (str, optional): the directory to resolve the modules.
+
+        Returns:
+            the value of the expression, which must be JSON serializable. If the evaluation fails, raise
+            ``RuntimeError``.
+        """
+        request = json.dumps({'cwd': os.path.abspath(cwd), 'expr': expr})
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._process = subprocess.Popen(['node', '-e', _NODE_EVALUATOR_SCRIPT], stdin=subprocess.PIPE,
+                                                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                                 universal_newlines=True, encoding='utf-8', bufsize=1)
+            try:
+                self._process.stdin.write(request + '\n')
+                self._process.stdin.flush()
+                line = self._process.stdout.readline()
+            except OSError:
+                line = ''
+            if not line:
+                self._close()
+                raise RuntimeError('The node process exited unexpectedly.')
+        response = json.loads(line)
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response.get('value')
+
+    def _close(self):
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def close(self):
+        """Stop the ``node`` process. It will be restarted by the next :meth:`eval`."""
+        with self._lock:
+            self._close()
+
+
+_NODE_EVALUATOR = _NodeEvaluator()
+atexit.register(_NODE_EVALUATOR.close)
+
+
 def delete_path(path):
     """Delete whatever at the path if it exists. If it's a file, remove it and it's index file.
     If it's a directory, remove the whole directory.
@@ -66,6 +171,7 @@ def delete_path(path):
             os.remove(path)
 
 
+@lru_cache(maxsize=1024)
 def _split_name_version(module_name):
     """Split package name and version.
 
@@ -81,6 +187,77 @@ def _split_name_version(module_name):
     return module_name, ''
 
 
+def _read_local_module_info(pkg_name, cwd='.'):
+    """Get the version and the directory of a Node.js module installed in ``<cwd>/node_modules`` without ``node``,
+    which is the first place ``node`` looks for the module.
+
+    Returns:
+        2-tuple: ``(version, module_path)``, or ``None`` if the module is not there, or it's not simple enough to
+                 resolve in python (e.g. it defines ``"exports"``).
+    """
+    module_dir = os.path.join(cwd, 'node_modules', pkg_name)
+    try:
+        with open(os.path.join(module_dir, 'package.json'), 'r', encoding='utf-8') as f:
+            package = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(package, dict) or not isinstance(package.get('version'), str) or 'exports' in package:
+        return None
+    main = package.get('main') or 'index.js'
+    if not isinstance(main, str):
+        return None
+    main_path = os.path.join(module_dir, main)
+    if os.path.isfile(main_path) or os.path.isfile(main_path + '.js'):
+        module_path = os.path.dirname(os.path.realpath(main_path))
+    elif os.path.isfile(os.path.join(main_path, 'index.js')):
+        module_path = os.path.realpath(main_path)
+    else:
+        return None
+    return package['version'], module_path
+
+
+def _get_module_info(pkg_name, cwd='.'):
+    """Get the version and the directory of an installed Node.js module with a single ``node`` call.
+
+    Args:
+        pkg_name (str): the package name, ``(<@scope>/)<pkg_name>``, without the version.
+        cwd (str, optional): the directory to run the ``node`` command.
+
+    Returns:
+        2-tuple: ``(version, module_path)``. If the module is not installed, raise ``NotImplementedError``.
+    """
+    key = (pkg_name, os.path.abspath(cwd))
+    with _CACHE_LOCK:
+        if key in _MODULE_INFO_CACHE:
+            return _MODULE_INFO_CACHE[key]
+    info = _read_local_module_info(pkg_name, cwd)
+    if info is not None:
+        with _CACHE_LOCK:
+            _MODULE_INFO_CACHE[key] = info
+        return info
+    # read the "package.json" from the disk rather than ``require`` it, which would be cached by ``node``
+    expr = (f'[JSON.parse(require("fs").readFileSync(require.resolve({pkg_name + "/package.json"!r}))).version, '
+            f'(() => {{try {{return require.resolve({pkg_name!r});}} catch (e) {{return "";}}}})()]')
+    try:
+        module_version, module_index = _NODE_EVALUATOR.eval(expr, cwd)
+    except (OSError, RuntimeError):
+        raise NotImplementedError(f'Cannot find module "{pkg_name}" in working directory {cwd}, '
+                                  f'please install or link this Node.js package first.')
+    module_path, _ = os.path.split(module_index)
+    info = (module_version or '', module_path)
+    with _CACHE_LOCK:
+        _MODULE_INFO_CACHE[key] = info
+    return info
+
+
+def _clear_module_cache():
+    """Forget the cached versions and directories of the Node.js modules, e.g. after ``npm install``"""
+    with _CACHE_LOCK:
+        _MODULE_INFO_CACHE.clear()
+    # ``node`` caches the module resolutions as well, start a new process next time
+    _NODE_EVALUATOR.close()
+
+
 def get_module_version(module_name, cwd='.'):
     """Get the version of an installed Node.js module.
 
@@ -91,13 +268,13 @@ def get_module_version(module_name, cwd='.'):
 
     Returns:
         str: the module version. If the module is not installed, raise ``NotImplementedError``.
+
+    Notes:
+        The result is cached per ``(pkg_name, cwd)`` until the next ``npm install`` run by this module.
     """
     pkg_name, _ = _split_name_version(module_name)
-    status, module_version = run_cmd(f'cd {cwd};node -p "require(\'{pkg_name}/package.json\').version"')
-    if status != 0:
-        raise NotImplementedError(f'Cannot find module "{pkg_name}" in working directory {cwd}, '
-                                  f'please install or link this Node.js package first.')
-    return module_version.strip()
+    module_version, _ = _get_module_info(pkg_name, cwd)
+    return module_version
 
 
 def get_module_dir(module_name, cwd='.'):
@@ -110,15 +287,16 @@ def get_module_dir(module_name, cwd='.'):
     Returns:
         str: the module path. If the module is not installed or the installed version is not the same as the required
              version, raise ``NotImplementedError``.
+
+    Notes:
+        The result is cached per ``(pkg_name, cwd)`` until the next ``npm install`` run by this module.
     """
-    install_version = get_module_version(module_name, cwd)
     pkg_name, require_version = _split_name_version(module_name)
+    install_version, module_path = _get_module_info(pkg_name, cwd)
     if require_version != '' and install_version != require_version:
         raise NotImplementedError(f'Module "{pkg_name}" is installed, but the installed version {install_version} is '
                                   f'not consistent with the required version {require_version}. Please install or link '
                                   f'the right version first.')
-    status, module_index = run_cmd(f'cd {cwd};node -p "require.resolve(\'{pkg_name}\')"')
-    module_path, _ = os.path.split(module_index)
     return module_path
 
 
@@ -136,26 +314,29 @@ def install_if_necessary(package, working_dir='.'):
     try:
         _ = get_module_dir(package, working_dir)
     except NotImplementedError as e:
-        cmd = f'cd {working_dir}; npm install {package}'
-        code, output = run_cmd(cmd, cwd=working_dir)
+        code, output = run_cmd(['npm', 'install', *_NPM_INSTALL_FLAGS, package], cwd=working_dir)
+        _clear_module_cache()
         assert code == 0, f'Could not link required node_modules: {package}. Error message: {output}'
         return output
     return ''
 
 
+def _is_installed(package, working_dir='.'):
+    """Check whether a Node.js package (in the required version if given) is installed"""
+    try:
+        get_module_dir(package, working_dir)
+    except NotImplementedError:
+        return False
+    return True
+
+
 # ======================================= JS2PY EXTENSIONS ===================================
 
 def _init():
     """Install dependencies for JS interpreting"""
-    if not os.path.exists(DEPENDENCY_PATH):
-        os.makedirs(DEPENDENCY_PATH)
-    assert subprocess.call(
-        'node -v >/dev/null 2>&1', shell=True, cwd=DEPENDENCY_PATH
-    ) == 0, 'You must have node installed! run: brew install node'
-    package_json_path = os.path.join(DEPENDENCY_PATH, 'package.json')
-    if not os.path.exists(package_json_path):
-        with open(package_json_path, 'w') as fobj:
-            fobj.write("{}")
+    global _INIT_DONE
+    if _INIT_DONE:
+        return
     dependencies = [
         'babel-core',
         'babel-cli',
@@ -165,8 +346,37 @@ def _init():
         'browserify',
         'browserify-shim'
     ]
-    for pkg in dependencies:
-        install_if_necessary(pkg, DEPENDENCY_PATH)
+    # skip the probes if the same dependencies have been installed before
+    expected_stamp = hashlib.sha1(','.join(sorted(dependencies)).encode('utf-8')).hexdigest()
+    stamp_path = os.path.join(DEPENDENCY_PATH, '.initialized')
+    if os.path.exists(stamp_path) and os.path.isdir(os.path.join(DEPENDENCY_PATH, 'node_modules')):
+        with open(stamp_path, 'r') as fobj:
+            if fobj.read() == expected_stamp:
+                _INIT_DONE = True
+                return
+    if not os.path.exists(DEPENDENCY_PATH):
+        os.makedirs(DEPENDENCY_PATH)
+    assert run_cmd(['node', '-v'], cwd=DEPENDENCY_PATH)[0] == 0, 'You must have node installed! run: brew install node'
+    package_json_path = os.path.join(DEPENDENCY_PATH, 'package.json')
+    if not os.path.exists(package_json_path):
+        with open(package_json_path, 'w') as fobj:
+            fobj.write("{}")
+    # probe all the dependencies concurrently
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+        installed = list(executor.map(lambda pkg: _is_installed(pkg, DEPENDENCY_PATH), dependencies))
+    missing = [pkg for pkg, ok in zip(dependencies, installed) if not ok]
+    if missing:
+        # install the missing ones in one ``npm install``, they all share the same ``package.json``
+        code, output = run_cmd(['npm', 'install', *_NPM_INSTALL_FLAGS, *missing], cwd=DEPENDENCY_PATH)
+        _clear_module_cache()
+        if code != 0:
+            logger.warning(f'Failed to install {", ".join(missing)} in batch, retry one by one. '
+                           f'Error message: {output}')
+            for pkg in missing:
+                install_if_necessary(pkg, DEPENDENCY_PATH)
+    with open(stamp_path, 'w') as fobj:
+        fobj.write(expected_stamp)
+    _INIT_DONE = True
 
 
 ADD_TO_GLOBALS_FUNC = '''
@@ -192,10 +402,12 @@ GET_FROM_GLOBALS_FUNC = '''
 '''
 
 
+@lru_cache(maxsize=1024)
 def _get_module_py_name(module_name):
     return module_name.replace('-', '_')
 
 
+@lru_cache(maxsize=1024)
 def _get_module_var_name(module_name):
     """Get the name of the python file"""
     pkg_name, _ = _split_name_version(module_name)
@@ -230,6 +442,54 @@ def get_module_py_path(module_name):
     return module_py_path
 
 
+def _read_header_and_body(path, need_body=False):
+    """Read the version from the header line of a translated python module, and its code if needed.
+
+    Args:
+        path (str): the path of the python module
+        need_body (bool, optional): whether to read the code after the header line
+
+    Returns:
+        2-tuple: ``(version, body)``. ``body`` is ``None`` if it's not needed, or if it doesn't start with
+                 ``DEFAULT_HEADER``, in which case the rest of the file is not read at all.
+    """
+    with codecs.open(path, "r", "utf-8") as f:
+        if need_body:
+            header = f.readline()
+        else:
+            # the version is short, no need to scan for the end of the line
+            header = f.read(len(_HEADER_PREFIX) + 64)
+            if '\n' not in header:
+                header += f.readline()
+        header = header.split('\n', 1)[0].strip()
+        version = header[len(_HEADER_PREFIX):] if header.startswith(_HEADER_PREFIX) else ''
+        if not need_body:
+            return version, None
+        prefix = f.read(len(DEFAULT_HEADER))
+        if prefix != DEFAULT_HEADER:
+            return version, None
+        return version, prefix + f.read()
+
+
+def _read_module_meta(path):
+    """Read the version of a translated python module from its sidecar ``<path>.meta`` file.
+
+    Args:
+        path (str): the path of the python module
+
+    Returns:
+        str: the version, or ``None`` if the ``.meta`` file is missing, broken or older than the python module.
+    """
+    meta_path = path + '.meta'
+    try:
+        if os.path.getmtime(meta_path) < os.path.getmtime(path):
+            return None
+        with open(meta_path, 'r') as f:
+            return json.load(f)['version']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
 def get_module_py_version(module_name):
     """Get the version of the python module
 
@@ -242,9 +502,9 @@ def get_module_py_version(module_name):
     mod_py_path = get_module_py_path(module_name)
     if not os.path.exists(mod_py_path):
         raise NotImplementedError(f'The python module of "{pkg_name}" does not exist!')
-    with codecs.open(mod_py_path, "r", "utf-8") as f:
-        header = f.readline().strip()
-    version = header[11:]
+    version = _read_module_meta(mod_py_path)
+    if version is None:
+        version, _ = _read_header_and_body(mod_py_path)
     return version
 
 
@@ -269,10 +529,12 @@ def translate_npm_module(module_name, include_polyfill=False, cwd='.'):
     module_path = get_module_dir(module_name, cwd)
 
     _init()
-    module_hash = hashlib.sha1(module_name.encode("utf-8")).hexdigest()[:15]
-    version = random.randrange(10000000000000)
-    in_file_name = 'in_%s_%d.js' % (module_hash, version)
-    out_file_name = 'out_%s_%d.js' % (module_hash, version)
+    in_fd, in_path = tempfile.mkstemp(suffix='.js', prefix='in_', dir=DEPENDENCY_PATH)
+    os.close(in_fd)
+    out_fd, out_path = tempfile.mkstemp(suffix='.js', prefix='out_', dir=DEPENDENCY_PATH)
+    os.close(out_fd)
+    in_file_name = os.path.basename(in_path)
+    out_file_name = os.path.basename(out_path)
     try:
         code = ADD_TO_GLOBALS_FUNC
         if include_polyfill:
@@ -281,61 +543,138 @@ def translate_npm_module(module_name, include_polyfill=False, cwd='.'):
             var module_temp_love_python = require(%s);
             addToGlobals(%s, module_temp_love_python);
             """ % (repr(module_path), repr(module_name))
-        with open(os.path.join(DEPENDENCY_PATH, in_file_name), 'wb') as f:
-            f.write(code.encode('utf-8') if six.PY3 else code)
+        with open(in_path, 'wb') as f:
+            f.write(code.encode('utf-8'))
 
         # convert the module
-        assert subprocess.call(
-            '''node -e "(require('browserify')('./%s').bundle(function (err,data) {if (err) {console.log(err);throw new Error(err);};fs.writeFile('%s', require('babel-core').transform(data, {'presets': require('babel-preset-es2015')}).code, ()=>{});}))"'''
-            % (in_file_name, out_file_name),
-            shell=True,
+        p = subprocess.Popen(
+            ['node', '-e',
+             '''(require('browserify')('./%s').bundle(function (err,data) {if (err) {console.log(err);throw new Error(err);};fs.writeFile('%s', require('babel-core').transform(data, {'presets': require('babel-preset-es2015')}).code, ()=>{});}))'''
+             % (in_file_name, out_file_name)],
             cwd=DEPENDENCY_PATH,
-        ) == 0, 'Error when converting module to the js bundle'
-
-        os.remove(os.path.join(DEPENDENCY_PATH, in_file_name))
-        with codecs.open(os.path.join(DEPENDENCY_PATH, out_file_name), "r",
-                         "utf-8") as f:
+        )
+        try:
+            # prepare the rest while the bundling is running
+            js_suffix = GET_FROM_GLOBALS_FUNC + ';var %s = getFromGlobals(%s);%s' % (
+                var_name, repr(module_name), var_name)
+            py_path = get_module_py_path(module_name)
+            os.makedirs(os.path.dirname(py_path), exist_ok=True)
+        except BaseException:
+            p.kill()
+            p.wait()
+            raise
+        assert p.wait() == 0, 'Error when converting module to the js bundle'
+
+        os.remove(in_path)
+        with codecs.open(out_path, "r", "utf-8") as f:
             js_code = f.read()
-        print("Bundled JS library dumped at: %s" % os.path.join(DEPENDENCY_PATH, out_file_name))
+        print("Bundled JS library dumped at: %s" % out_path)
         if len(js_code) < 50:
             raise RuntimeError("Candidate JS bundle too short - likely browserify issue.")
-        js_code += GET_FROM_GLOBALS_FUNC
-        js_code += ';var %s = getFromGlobals(%s);%s' % (
-            var_name, repr(module_name), var_name)
+        js_code += js_suffix
         print('Please wait, translating...')
         py_code = translate_js(js_code)
 
-        py_path = get_module_py_path(module_name)
         with open(py_path, 'wb') as f:
-            py_code = f"# version: {module_version}\n" + py_code
-            f.write(py_code.encode('utf-8') if six.PY3 else py_code)
-
-        os.remove(os.path.join(DEPENDENCY_PATH, out_file_name))
+            py_code = f"{_HEADER_PREFIX}{module_version}\n" + py_code
+            f.write(py_code.encode('utf-8'))
+        with open(py_path + '.meta', 'w') as f:
+            json.dump({'version': module_version}, f)
+        # compile it once here, so that ``require`` doesn't need to compile the source every time
+        try:
+            py_compile.compile(py_path, cfile=py_path + 'c', doraise=True,
+                               invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP)
+        except py_compile.PyCompileError as e:
+            logger.warning(f'Failed to compile the python module of "{module_name}": {e.msg}')
+        _clear_required_module(module_name)
+
+        os.remove(out_path)
     except Exception as e:
-        delete_path(os.path.join(DEPENDENCY_PATH, in_file_name))
-        delete_path(os.path.join(DEPENDENCY_PATH, out_file_name))
+        delete_path(in_path)
+        delete_path(out_path)
         raise e
 
 
+def _load_compiled_code(path):
+    """Load the code object of a translated python module from ``<path>c`` compiled by
+    :func:`translate_npm_module`.
+
+    Args:
+        path (str): the path of the python module
+
+    Returns:
+        code: the code object, or ``None`` if the compiled file is missing or out of date.
+    """
+    try:
+        st = os.stat(path)
+        with open(path + 'c', 'rb') as f:
+            data = f.read(16)
+            # the header of a timestamp-based pyc: magic number, flags, source mtime, source size
+            if len(data) < 16 or data[:4] != importlib.util.MAGIC_NUMBER or data[4:8] != b'\0\0\0\0':
+                return None
+            if (int.from_bytes(data[8:12], 'little') != int(st.st_mtime) & 0xFFFFFFFF
+                    or int.from_bytes(data[12:16], 'little') != st.st_size & 0xFFFFFFFF):
+                return None
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
 def _load_python_code(module_name):
-    """Load the python code, and check the version"""
+    """Load the code object of the python module, and check the version.
+
+    The code object is cached in memory as long as the python module is not modified. Otherwise it's loaded from the
+    file compiled by :func:`translate_npm_module`, or compiled from the source if that's out of date.
+    """
     pkg_name, require_version = _split_name_version(module_name)
     mod_py_path = get_module_py_path(module_name)
     if not os.path.exists(mod_py_path):
         raise NotImplementedError(f'The python module of "{pkg_name}" does not exist!')
-    with codecs.open(mod_py_path, "r", "utf-8") as f:
-        header = f.readline().strip()
-        py_code = f.read()
-    version = header[11:]
+    version = _read_module_meta(mod_py_path)
+    if version is None:
+        version, _ = _read_header_and_body(mod_py_path)
     if require_version != '' and version != require_version:
         raise NotImplementedError(
             f'The python module of "{pkg_name}" is installed, but the version "{version}" is not '
             f'consistent with the required version "{require_version}".')
-    if not py_code.startswith(DEFAULT_HEADER):
-        raise NotImplementedError(
-            f'The python module of "{module_name}" is installed, but there is something wrong with '
-            f'the header. Re-translation is needed.')
-    return py_code
+    st = os.stat(mod_py_path)
+    signature = (st.st_mtime_ns, st.st_size)
+    with _REQUIRE_LOCK:
+        entry = _CODE_CACHE.get(mod_py_path)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    # an up-to-date compiled file means the module is not touched since it's translated, the header must be right
+    code = _load_compiled_code(mod_py_path)
+    if code is None:
+        _, py_code = _read_header_and_body(mod_py_path, need_body=True)
+        if py_code is None:
+            raise NotImplementedError(
+                f'The python module of "{module_name}" is installed, but there is something wrong with '
+                f'the header. Re-translation is needed.')
+        # start with an empty line in place of the version header, to keep the line numbers of the file
+        code = compile('\n' + py_code, mod_py_path, 'exec')
+    with _REQUIRE_LOCK:
+        _CODE_CACHE[mod_py_path] = (signature, code)
+    return code
+
+
+def _get_required_module_key(module_name):
+    """Get the key of the module in ``_REQUIRE_CACHE``. Return ``None`` if the python module does not exist."""
+    pkg_name, _ = _split_name_version(module_name)
+    try:
+        st = os.stat(get_module_py_path(module_name))
+        version = get_module_py_version(module_name)
+    except (OSError, NotImplementedError):
+        return None
+    return pkg_name, version, st.st_mtime_ns, st.st_size
+
+
+def _clear_required_module(module_name):
+    """Forget the loaded modules of a package, e.g. after it's re-translated"""
+    pkg_name, _ = _split_name_version(module_name)
+    with _REQUIRE_LOCK:
+        for key in [key for key in _REQUIRE_CACHE if key[0] == pkg_name]:
+            del _REQUIRE_CACHE[key]
 
 
 def require(module_name, context=None, include_polyfill=True, cwd='.'):
@@ -355,15 +694,31 @@ def require(module_name, context=None, include_polyfill=True, cwd='.'):
 
     Returns:
         js2py.JsObjectWrapper: the JS module
+
+    Notes:
+        If ``context`` is not given, the loaded module is cached and the same object is returned by the following
+        calls, until the python module is re-translated or modified.
     """
+    pkg_name, require_version = _split_name_version(module_name)
+    if context is None:
+        key = _get_required_module_key(module_name)
+        if key is not None and require_version in ('', key[1]):
+            with _REQUIRE_LOCK:
+                if key in _REQUIRE_CACHE:
+                    return _REQUIRE_CACHE[key]
     try:
-        py_code = _load_python_code(module_name)
+        code = _load_python_code(module_name)
     except NotImplementedError as e:
         logger.warning(str(e))
         translate_npm_module(module_name, include_polyfill=include_polyfill, cwd=cwd)
-        py_code = _load_python_code(module_name)
-    # py_code = py_code[len(DEFAULT_HEADER):]
+        code = _load_python_code(module_name)
+    cacheable = context is None
     context = {} if context is None else context
-    exec(py_code, context)
-    pkg_name, _ = _split_name_version(module_name)
-    return context['var'][_get_module_var_name(pkg_name)].to_py()
+    exec(code, context)
+    module = context['var'][_get_module_var_name(pkg_name)].to_py()
+    if cacheable:
+        key = _get_required_module_key(module_name)
+        if key is not None:
+            with _REQUIRE_LOCK:
+                _REQUIRE_CACHE[key] = module
+    return module
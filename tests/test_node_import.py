@@ -8,9 +8,8 @@ import unittest
 from io import StringIO
 from unittest.mock import patch
 
-import six
-
 from js2py.node_import import *
+from js2py.node_import import _clear_module_cache, _NODE_EVALUATOR
 
 BASE_DIR = os.path.dirname(__file__)
 
@@ -21,6 +20,8 @@ class TestJs2Py(unittest.TestCase):
         if os.path.exists(self.dirname):
             shutil.rmtree(self.dirname)
         os.makedirs(self.dirname)
+        # the temp directory is re-created, so forget what we knew about it
+        _clear_module_cache()
         with open(os.path.join(self.dirname, 'package.json'), 'w') as fobj:
             fobj.write('{}')
         self.py_dir = os.path.abspath(os.path.join(BASE_DIR, '../js2py/py_node_modules'))
@@ -31,6 +32,21 @@ class TestJs2Py(unittest.TestCase):
         code, output = run_cmd(f'echo 123')
         self.assertEqual(code, 0)
         self.assertEqual(output, '123\n')
+        # run without the shell
+        code, output = run_cmd(['node', '-p', '1 + 2'], cwd=self.dirname)
+        self.assertEqual(code, 0)
+        self.assertEqual(output, '3\n')
+        code, output = run_cmd(['not-a-command-at-all'])
+        self.assertEqual(code, 127)
+
+    def test_node_evaluator(self):
+        self.assertEqual(_NODE_EVALUATOR.eval('1 + 2'), 3)
+        self.assertEqual(_NODE_EVALUATOR.eval('require("path").basename(".")', self.dirname), '.')
+        with self.assertRaises(RuntimeError):
+            _NODE_EVALUATOR.eval('require("not-a-module-at-all")', self.dirname)
+        # restart after closed
+        _NODE_EVALUATOR.close()
+        self.assertEqual(_NODE_EVALUATOR.eval('[1, "a"]'), [1, 'a'])
 
     def test_node_extensions(self):
         package = 'crypto-js'
@@ -65,6 +81,22 @@ class TestJs2Py(unittest.TestCase):
         self.assertEqual(module_dir, os.path.join(self.dirname, 'node_modules/crypto-js'))
         self.assertEqual(module_version, '3.1.9-1')
 
+    def test_module_cache(self):
+        module_dir = os.path.join(self.dirname, 'node_modules', 'fake-pkg')
+        os.makedirs(module_dir)
+        with open(os.path.join(module_dir, 'package.json'), 'w') as fobj:
+            json.dump({'name': 'fake-pkg', 'version': '1.0.0'}, fobj)
+        with open(os.path.join(module_dir, 'index.js'), 'w') as fobj:
+            fobj.write('module.exports = 1;')
+        self.assertEqual(get_module_version('fake-pkg', self.dirname), '1.0.0')
+        self.assertEqual(get_module_dir('fake-pkg', self.dirname), module_dir)
+        # the probes are cached until the next ``npm install``
+        with open(os.path.join(module_dir, 'package.json'), 'w') as fobj:
+            json.dump({'name': 'fake-pkg', 'version': '2.0.0'}, fobj)
+        self.assertEqual(get_module_version('fake-pkg', self.dirname), '1.0.0')
+        _clear_module_cache()
+        self.assertEqual(get_module_version('fake-pkg', self.dirname), '2.0.0')
+
     def test_get_module_py_path(self):
         self.assertEqual(get_module_py_path('ab-c'), os.path.join(self.py_dir, 'ab_c.py'))
         self.assertEqual(get_module_py_path('ab-c@1.0.0'), os.path.join(self.py_dir, 'ab_c.py'))
@@ -92,6 +124,9 @@ class TestJs2Py(unittest.TestCase):
             translate_npm_module(package, False, cwd=self.dirname)
         self.assertTrue(os.path.exists(package_path))
         self.check_translate_output(output)
+        with open(package_path + '.meta') as fobj:
+            self.assertEqual(json.load(fobj), {'version': '3.1.9-1'})
+        self.assertTrue(os.path.exists(package_path + 'c'))
         if os.path.exists(package_path):
             os.remove(package_path)
         with patch('sys.stdout', new=StringIO()) as output:
@@ -167,7 +202,7 @@ class TestJs2Py(unittest.TestCase):
         # Python module header wrong, re-translate
         with open(python_path, 'wb') as fobj:
             content = f"# version: 3.1.9-1\n123456"
-            fobj.write(content.encode('utf-8') if six.PY3 else content)
+            fobj.write(content.encode('utf-8'))
         with patch('sys.stdout', new=StringIO()) as output:
             with self.assertLogs(level='WARNING') as cm:
                 CryptoJS = require(package_v, cwd=self.dirname)
@@ -185,8 +220,12 @@ class TestJs2Py(unittest.TestCase):
         self.assertEqual(output.getvalue(), '')
         self.assertTrue(os.path.exists(python_path))
         test_module(CryptoJS)
-        if os.path.exists(python_path):
-            os.remove(python_path)
+        # loaded only once without the context
+        self.assertIs(require(package, cwd=self.dirname), CryptoJS)
+        self.assertIsNot(require(package, context={}, cwd=self.dirname), CryptoJS)
+        for path in (python_path, python_path + 'c', python_path + '.meta'):
+            if os.path.exists(path):
+                os.remove(path)
 
     def tearDown(self):
         if os.path.exists(self.dirname):